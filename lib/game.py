@@ -1,22 +1,48 @@
 """Game class module."""
+import sys
+
 from lib.player import Player
 
 
+class _TrieNode:
+    """Node of the word list prefix trie.
+
+    :attr dict[str,_TrieNode] children: child nodes keyed by letter
+    :attr bool is_word: True if the path to this node spells a valid word
+    """
+
+    __slots__ = ('children', 'is_word')
+
+    def __init__(self):
+        """Initialize an empty _TrieNode object."""
+        self.children = {}
+        self.is_word = False
+
+
 class Game:
     """Controlling game object class.
 
     :attr int player_count: number of players in the game
     :attr list[Player] players: list of all players in the game
     :attr Player current_player: player whose turn it is
+    :attr int current_player_idx: index of the current player in the
+        player list
     :attr int min_word_length: minimum word length for a word to be
         considered valid
     :attr str ghost_word: the player strike counter word
+    :attr tuple[str] ghost_word_prefixes: prefixes of the ghost word,
+        indexed by number of strikes
     :attr int num_strikes_allowed: the number of strikes a player is allowed
         before they are eliminated; corresponds to the length of the ghost
         word
-    :attr list[str] word_list: list of valid words in the game's dictionary
+    :attr frozenset[str] word_list: set of valid words in the game's
+        dictionary
+    :attr str word_list_type: type of word list used by the game
+    :attr _TrieNode word_trie: root of the prefix trie built from the
+        word list; None until the first prefix query
     :attr str current_word_fragment: the round's current word fragment
     :attr bool game_is_over: True if the game is over, False otherwise
+    :attr bool quiet: True if game messages are suppressed, False otherwise
     """
 
     word_list_filepaths = {
@@ -24,8 +50,14 @@ class Game:
         'webster': 'data/webster.txt'
     }
 
+    # loaded word lists, and tries once a prefix query has built them,
+    # shared by every game in the process and keyed by
+    # (word_list_type, min_word_length)
+    _word_list_cache = {}
+    _word_trie_cache = {}
+
     def __init__(self, player_configs, min_word_length=4,
-                 ghost_word='GHOST', word_list_type='scrabble'):
+                 ghost_word='GHOST', word_list_type='scrabble', quiet=False):
         """Initialize a Game object.
 
         :param list[dict[str,str]] player_configs: list of player
@@ -36,7 +68,11 @@ class Game:
             defaults to 'GHOST'
         :param str word_list_type: (optional) type of word list to use;
             must be 'scrabble' or 'webster'; defaults to 'scrabble'
+        :param bool quiet: (optional) suppress game messages, e.g. for
+            games between computer players; defaults to False
         """
+        self.quiet = quiet
+
         # set player variables
         self.player_count = 0
         self.players = Player.init_players_from_configs(
@@ -44,10 +80,15 @@ class Game:
             player_configs=player_configs
         )
         self.current_player = None
+        self.current_player_idx = 0
 
         # set gameplay variables
         self.min_word_length = min_word_length
         self.ghost_word = ghost_word.upper()
+        self.ghost_word_prefixes = tuple(
+            self.ghost_word[:strikes]
+            for strikes in range(len(self.ghost_word) + 1)
+        )
         self.num_strikes_allowed = len(ghost_word)
         if word_list_type not in Game.word_list_filepaths.keys():
             invalid_word_list_err_msg = (
@@ -56,7 +97,9 @@ class Game:
                 f"{Game.word_list_filepaths.keys()}"
             )
             raise ValueError(invalid_word_list_err_msg)
+        self.word_list_type = word_list_type
         self.word_list = self.load_word_list(word_list_type)
+        self.word_trie = None
 
         # set current game status variables
         self.current_word_fragment = ''
@@ -67,25 +110,84 @@ class Game:
 
         :param str word_list_type: type of word list to use; must be 'scrabble'
             or 'webster'
-        :return: list of allowed words in the dictionary
-        :rtype: list[str]
+        :return: set of allowed words in the dictionary
+        :rtype: frozenset[str]
         """
+        cache_key = (word_list_type, self.min_word_length)
+        if cache_key in Game._word_list_cache:
+            return Game._word_list_cache[cache_key]
+
         word_list_filepath = Game.word_list_filepaths[word_list_type]
-        with open(word_list_filepath, 'r') as word_list_file:
-            word_list_raw = word_list_file.readlines()
-        word_list = [word.strip().lower() for word in word_list_raw
-                     if len(word.strip()) >= self.min_word_length]
+        # read the whole file in one call and split it in bytes, which is
+        # much faster than iterating and stripping line by line
+        with open(word_list_filepath, 'rb') as word_list_file:
+            word_list_raw = word_list_file.read().lower().splitlines()
+        word_list = frozenset(word.decode('ascii') for word in word_list_raw
+                              if word and len(word) >= self.min_word_length)
+        Game._word_list_cache[cache_key] = word_list
         return word_list
 
+    def load_word_trie(self, word_list_type):
+        """Load the prefix trie of the word list.
+
+        :param str word_list_type: type of word list to use; must be 'scrabble'
+            or 'webster'
+        :return: root node of the word list trie
+        :rtype: _TrieNode
+        """
+        cache_key = (word_list_type, self.min_word_length)
+        if cache_key not in Game._word_trie_cache:
+            word_list = self.load_word_list(word_list_type)
+            Game._word_trie_cache[cache_key] = self.build_word_trie(word_list)
+        return Game._word_trie_cache[cache_key]
+
+    @staticmethod
+    def build_word_trie(word_list):
+        """Build a prefix trie from a word list.
+
+        :param frozenset[str] word_list: words to insert into the trie
+        :return: root node of the trie
+        :rtype: _TrieNode
+        """
+        root = _TrieNode()
+        for word in word_list:
+            node = root
+            for letter in word:
+                child = node.children.get(letter)
+                if child is None:
+                    child = node.children[letter] = _TrieNode()
+                node = child
+            node.is_word = True
+        return root
+
+    def find_trie_node(self, fragment):
+        """Find the trie node reached by following a word fragment.
+
+        :param str fragment: word fragment to follow from the trie root
+        :return: the node at the end of the fragment, or None if no word in
+            the game's dictionary starts with the fragment
+        :rtype: _TrieNode or None
+        """
+        if self.word_trie is None:
+            self.word_trie = self.load_word_trie(self.word_list_type)
+        node = self.word_trie
+        for letter in fragment:
+            node = node.children.get(letter)
+            if node is None:
+                return None
+        return node
+
     def start(self):
         """Start the game."""
-        self.current_player = self.players[0]
+        self.current_player_idx = 0
         while not self.game_is_over:
-            print(f"\n--{self.current_player.name}'s turn--")
-            next_player = self.get_next_player()
+            self.current_player = self.players[self.current_player_idx]
+            self.log(f"\n--{self.current_player.name}'s turn--")
             self.current_player.take_turn()
             self.check_for_game_over()
-            self.current_player = next_player
+            self.current_player_idx = (
+                (self.current_player_idx + 1) % self.player_count
+            )
 
     def get_next_player(self):
         """Get the next remaining player after the current player.
@@ -93,11 +195,7 @@ class Game:
         :return: the player after the current player
         :rtype: Player
         """
-        current_player_idx = self.players.index(self.current_player)
-        if current_player_idx + 1 == self.player_count:
-            next_player_idx = 0
-        else:
-            next_player_idx = current_player_idx + 1
+        next_player_idx = (self.current_player_idx + 1) % self.player_count
         next_player = self.players[next_player_idx]
         return next_player
 
@@ -107,11 +205,9 @@ class Game:
         :return: the player before the current player
         :rtype: Player
         """
-        current_player_idx = self.players.index(self.current_player)
-        if current_player_idx == 0:
-            previous_player_idx = self.player_count - 1
-        else:
-            previous_player_idx = current_player_idx - 1
+        previous_player_idx = (
+            (self.current_player_idx - 1) % self.player_count
+        )
         previous_player = self.players[previous_player_idx]
         return previous_player
 
@@ -119,7 +215,7 @@ class Game:
         """Check if the game is over."""
         if self.player_count == 1:
             winning_player = self.players[0]
-            print(f"{winning_player.name} has won the game!\n\n")
+            self.log(f"{winning_player.name} has won the game!\n\n")
             self.game_is_over = True
 
     def eliminate_player(self, player):
@@ -127,10 +223,29 @@ class Game:
 
         :param Player player: player to eliminate
         """
-        print(f"{player.name} has {self.ghost_word} and has been eliminated!")
-        self.players.remove(player)
+        self.log(
+            f"{player.name} has {self.ghost_word} and has been eliminated!"
+        )
+        player_idx = self.players.index(player)
+        del self.players[player_idx]
         self.player_count = len(self.players)
 
+        # keep the current player index pointing at the player before the
+        # next one to play, so advancing it skips the eliminated player
+        if player_idx <= self.current_player_idx:
+            self.current_player_idx -= 1
+
+    def log(self, *messages):
+        """Write game messages to standard output.
+
+        All messages are joined into a single write, one message per line.
+        Nothing is written if the game is quiet.
+
+        :param str messages: messages to write
+        """
+        if not self.quiet:
+            sys.stdout.write('\n'.join(messages) + '\n')
+
     def reset_current_word_fragment(self):
         """Reset the current game's word fragment back to an empty string."""
         self.current_word_fragment = ''
@@ -150,8 +265,7 @@ class Game:
             return False
 
         is_playable = intended_word.startswith(self.current_word_fragment)
-        is_valid = self.is_valid_word(intended_word)
-        return is_playable and is_valid
+        return is_playable and self.is_valid_word(intended_word)
 
     def is_valid_word(self, word):
         """Validate that a given word is in the game's dictionary.
@@ -161,3 +275,13 @@ class Game:
         :rtype: bool
         """
         return word in self.word_list
+
+    def has_prefix(self, fragment):
+        """Check if any word in the game's dictionary starts with a fragment.
+
+        :param str fragment: word fragment to check
+        :return: True if at least one valid word starts with the fragment,
+            False otherwise
+        :rtype: bool
+        """
+        return self.find_trie_node(fragment) is not None
@@ -1,7 +1,8 @@
 """Player class module."""
-import copy
 import string
 
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+
 
 class Player:
     """Player class.
@@ -70,7 +71,8 @@ class Player:
         """
         players = []
         for player_config in player_configs:
-            player_config = copy.deepcopy(player_config)
+            # shallow copy so the caller's config is left untouched
+            player_config = dict(player_config)
 
             player_config['game'] = game
 
@@ -131,12 +133,14 @@ class Player:
 
         self.current_strikes += 1
 
-        player_ghost_word = self.game.ghost_word[:self.current_strikes]
+        player_ghost_word = self.game.ghost_word_prefixes[
+            self.current_strikes
+        ]
         lost_round_msg = (
             f"{self.name} has lost the round; they gain one letter, "
             f"and they now have '{player_ghost_word}'"
         )
-        print(lost_round_msg)
+        self.game.log(lost_round_msg)
 
         if self.current_strikes == self.game.num_strikes_allowed:
             self.game.eliminate_player(self)
@@ -148,12 +152,12 @@ class Player:
         """
         if len(letter) != 1:
             raise ValueError(f"{letter} is not a letter")
-        if letter not in list(string.ascii_lowercase):
+        if letter not in _ASCII_LOWER:
             raise ValueError(f"Invalid letter: {letter}")
 
         self.game.current_word_fragment += letter
-        print(f"{self.name} played the letter '{letter}'")
-        print(
+        self.game.log(
+            f"{self.name} played the letter '{letter}'",
             f"The current word fragment is "
             f"'{self.game.current_word_fragment}'"
         )
@@ -169,7 +173,6 @@ class Player:
             f"'{self.game.current_word_fragment}', for having "
             f"accidentally completed a valid word"
         )
-        print(challenge_msg)
 
         # if the previous player spelled a word and is challenged the
         # previous player loses the round, otherwise the current player
@@ -180,14 +183,14 @@ class Player:
                 f"The word fragment {current_word_fragment} is a valid "
                 f"word, therefore {previous_player.name} loses the round"
             )
-            print(prev_player_valid_word_msg)
+            self.game.log(challenge_msg, prev_player_valid_word_msg)
             previous_player.lose_round()
         else:
             prev_player_invalid_word_msg = (
                 f"The word fragment {current_word_fragment} is not a "
                 f"valid word, therefore {self.name} loses the round"
             )
-            print(prev_player_invalid_word_msg)
+            self.game.log(challenge_msg, prev_player_invalid_word_msg)
             self.lose_round()
 
     def challenge_previous_player_as_impossible(self):
@@ -205,7 +208,7 @@ class Player:
             f"'{self.game.current_word_fragment}', for having created "
             f"a word fragment that is impossible to complete"
         )
-        print(challenge_msg)
+        self.game.log(challenge_msg)
 
         # if the previous player's intended word is valid, the current
         # player loses the round; otherwise, the previous player loses
@@ -217,7 +220,7 @@ class Player:
                 f"'{prev_player_intended_word}', is a valid word, "
                 f"therefore {self.name} loses the round"
             )
-            print(prev_player_valid_intended_word_msg)
+            self.game.log(prev_player_valid_intended_word_msg)
             self.lose_round()
         else:
             prev_player_invalid_intended_word_msg = (
@@ -225,7 +228,7 @@ class Player:
                 f"'{prev_player_intended_word}', is NOT a valid word, "
                 f"therefore {previous_player.name} loses the round"
             )
-            print(prev_player_invalid_intended_word_msg)
+            self.game.log(prev_player_invalid_intended_word_msg)
             previous_player.lose_round()
 
     def forfeit_round(self):
@@ -235,7 +238,7 @@ class Player:
         valid words, or if the only valid words left will complete a
         word for the player.
         """
-        print(f"{self.name} is stumped and is forfeiting the round")
+        self.game.log(f"{self.name} is stumped and is forfeiting the round")
         self.lose_round()
 
 
@@ -268,32 +271,36 @@ class HumanPlayer(Player):
         Game turns can either be playing a letter, challenging the
         previous player, or forfeiting the round.
         """
-        turn_type = input("TURN TYPE:\t")
-
-        if turn_type == 'play':
-            letter_to_play = input("LETTER:\t").lower()
-            if len(letter_to_play) != 1:
-                print(f"{letter_to_play} is not a letter")
-                self.take_turn()
-            elif letter_to_play not in list(string.ascii_lowercase):
-                print(f"Invalid letter: {letter_to_play}")
-                self.take_turn()
-            else:
-                self.play_letter(letter_to_play)
+        # keep prompting until the player makes a valid move
+        while True:
+            turn_type = input("TURN TYPE:\t")
+
+            if turn_type == 'play':
+                letter_to_play = input("LETTER:\t").lower()
+                if len(letter_to_play) != 1:
+                    print(f"{letter_to_play} is not a letter")
+                    continue
+                elif letter_to_play not in _ASCII_LOWER:
+                    print(f"Invalid letter: {letter_to_play}")
+                    continue
+                else:
+                    self.play_letter(letter_to_play)
+                    return
+
+            elif turn_type == 'challenge':
+                if self.game.current_word_fragment == '':
+                    print("Cannot challenge on first turn of round")
+                    continue
+                else:
+                    self.challenge_previous_player()
+                    return
+
+            elif turn_type == 'forfeit':
+                self.forfeit_round()
+                return
 
-        elif turn_type == 'challenge':
-            if self.game.current_word_fragment == '':
-                print("Cannot challenge on first turn of round")
-                self.take_turn()
             else:
-                self.challenge_previous_player()
-
-        elif turn_type == 'forfeit':
-            self.forfeit_round()
-
-        else:
-            print("Turn type must be 'play', 'challenge', or 'forfeit'")
-            self.take_turn()
+                print("Turn type must be 'play', 'challenge', or 'forfeit'")
 
     def respond_to_challenge(self):
         """Respond to another player's challenge with the intended word.